@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, Optional, List
 import os
+import httpx
 import logging
 from dataclasses import dataclass
 from langchain_openai import ChatOpenAI
@@ -41,15 +42,21 @@ class AgentResponse(BaseModel):
 class BaseAgent:
     # Base AI agent with LangChain and MCP support
     
-    def __init__(self, config: AgentConfig, system_prompt: str = "You are a helpful AI assistant."):
+    def __init__(
+        self,
+        config: AgentConfig,
+        system_prompt: str = "You are a helpful AI assistant.",
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.config = config
         self.system_prompt = system_prompt
         
-        # LangChain ChatOpenAI setup
+        # LangChain ChatOpenAI setup (shared pooled client if given)
         self.llm = ChatOpenAI(
             base_url=config.api_base_url,
             api_key=config.api_key,
-            model=config.model_name
+            model=config.model_name,
+            http_async_client=http_client
         )
         
         # MCP client lazy init
@@ -114,10 +121,10 @@ class BaseAgent:
 class SearchAgent(BaseAgent):
     # Web search and research agent
     
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, http_client: Optional[httpx.AsyncClient] = None):
         system_prompt = "Research assistant with web search tools. Use search for current info, cite sources."
         
-        super().__init__(config, system_prompt)
+        super().__init__(config, system_prompt, http_client)
         
         # Web search MCP setup
         self.setup_web_search_mcp()
@@ -140,7 +147,7 @@ class SearchAgent(BaseAgent):
 class ChatAgent(BaseAgent):
     # General chat and assistance agent
     
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, http_client: Optional[httpx.AsyncClient] = None):
         system_prompt = "Friendly conversational AI. Natural conversations, explanations, analysis. Helpful, harmless, honest."
         
-        super().__init__(config, system_prompt)
+        super().__init__(config, system_prompt, http_client)
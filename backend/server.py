@@ -1,16 +1,22 @@
 from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.server_api import ServerApi
+import httpx
+import orjson
+import asyncio
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import AwareDatetime, BaseModel, Field
+from typing import Dict, List, Optional, Tuple
 import uuid
-from datetime import datetime
-import requests
-import base64
+import zlib
+from datetime import datetime, timezone
+from functools import lru_cache
 
 # AI agents
 from ai_agents.agents import AgentConfig, SearchAgent, ChatAgent
@@ -21,16 +27,32 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    server_api=ServerApi("1"),
+    compressors="zstd,snappy",
+    maxPoolSize=100,
+    minPoolSize=10,
+    waitQueueTimeoutMS=2000,
+    retryWrites=True,
+    tz_aware=True
+)
 db = client[os.environ['DB_NAME']]
 
+# Skip model validation on documents read back from MongoDB
+trusted_db_reads = os.environ.get('TRUSTED_DB_READS', 'true').lower() == 'true'
+
 # AI agents init
 agent_config = AgentConfig()
 search_agent: Optional[SearchAgent] = None
 chat_agent: Optional[ChatAgent] = None
 
 # Main app
-app = FastAPI(title="AI Agents API", description="Minimal AI Agents API with LangGraph and MCP support")
+app = FastAPI(
+    title="AI Agents API",
+    description="Minimal AI Agents API with LangGraph and MCP support",
+    default_response_class=ORJSONResponse
+)
 
 # API router
 api_router = APIRouter(prefix="/api")
@@ -40,11 +62,13 @@ api_router = APIRouter(prefix="/api")
 class StatusCheck(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     client_name: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: AwareDatetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+_STATUS_CHECK_PROJECTION = {"_id": 0, "id": 1, "client_name": 1, "timestamp": 1}
+
 
 # AI agent models
 class ChatRequest(BaseModel):
@@ -76,6 +100,15 @@ class SearchResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Prebuilt failure payloads - error paths only fill in the per-request fields
+_CHAT_ERROR_TEMPLATE = ChatResponse.model_construct(
+    success=False, response="", agent_type="", capabilities=[], metadata={}, error=None
+).model_dump()
+_SEARCH_ERROR_TEMPLATE = SearchResponse.model_construct(
+    success=False, query="", summary="", search_results=None, sources_count=0, error=None
+).model_dump()
+
+
 class WallpaperRequest(BaseModel):
     prompt: str
     aspect_ratio: str = "9:16"  # Default to phone aspect ratio
@@ -89,6 +122,69 @@ class WallpaperResponse(BaseModel):
     aspect_ratio: str
     error: Optional[str] = None
 
+
+# Wallpaper catalog - curated demo images keyed by prompt keyword
+_SAMPLE_WALLPAPERS: Dict[str, Tuple[str, ...]] = {
+    "nature": (
+        "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1441974231531-c6227db76b6e?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1501594907352-04cda38ebc29?w=512&h=910&fit=crop&auto=format"
+    ),
+    "city": (
+        "https://images.unsplash.com/photo-1449824913935-59a10b8d2000?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1519501025264-65ba15a82390?w=512&h=910&fit=crop&auto=format"
+    ),
+    "abstract": (
+        "https://images.unsplash.com/photo-1618005182384-a83a8bd57fbe?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1557683304-673a23048d34?w=512&h=910&fit=crop&auto=format"
+    ),
+    "space": (
+        "https://images.unsplash.com/photo-1446776877081-d282a0f896e2?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1419242902214-272b3f66ee7a?w=512&h=910&fit=crop&auto=format"
+    ),
+    "dark": (
+        "https://images.unsplash.com/photo-1618556450991-2f1af64e8191?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1547036967-23d11aacaee0?w=512&h=910&fit=crop&auto=format"
+    ),
+    "minimal": (
+        "https://images.unsplash.com/photo-1557683316-973673baf926?w=512&h=910&fit=crop&auto=format",
+        "https://images.unsplash.com/photo-1574169208507-84376144848b?w=512&h=910&fit=crop&auto=format"
+    )
+}
+
+# Default wallpapers for any prompt
+_DEFAULT_WALLPAPERS: Tuple[str, ...] = (
+    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=512&h=910&fit=crop&auto=format",
+    "https://images.unsplash.com/photo-1441974231531-c6227db76b6e?w=512&h=910&fit=crop&auto=format",
+    "https://images.unsplash.com/photo-1449824913935-59a10b8d2000?w=512&h=910&fit=crop&auto=format",
+    "https://images.unsplash.com/photo-1618005182384-a83a8bd57fbe?w=512&h=910&fit=crop&auto=format"
+)
+
+# Category keywords in match priority order
+_CATEGORY_KEYS = tuple(_SAMPLE_WALLPAPERS.keys())
+
+# Image dimensions per supported aspect ratio (catalog URLs are 9:16)
+_ASPECT_RATIO_DIMENSIONS: Dict[str, str] = {
+    "9:16": "w=512&h=910",
+    "16:9": "w=910&h=512",
+    "1:1": "w=512&h=512",
+    "3:4": "w=512&h=683"
+}
+_SUPPORTED_ASPECT_RATIOS = frozenset(_ASPECT_RATIO_DIMENSIONS)
+
+# Resized URL variants: category (or "default") -> aspect ratio -> urls
+_WALLPAPERS_BY_RATIO: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    category: {
+        ratio: tuple(url.replace("w=512&h=910", dimensions) for url in wallpapers)
+        for ratio, dimensions in _ASPECT_RATIO_DIMENSIONS.items()
+    }
+    for category, wallpapers in {**_SAMPLE_WALLPAPERS, "default": _DEFAULT_WALLPAPERS}.items()
+}
+
+# Pre-serialized WallpaperResponse body for the success path
+_WALLPAPER_RESPONSE_TEMPLATE = b'{"success":true,"image_url":"%s","prompt":%s,"aspect_ratio":"%s","error":null}'
+
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -96,31 +192,25 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
+    status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    _ = await db.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    # Fetch only model fields in a single batch; docs were validated on insert
+    cursor = db.status_checks.find({}, projection=_STATUS_CHECK_PROJECTION).batch_size(1000)
+    status_checks = await cursor.to_list(1000)
+    build = StatusCheck.model_construct if trusted_db_reads else StatusCheck
+    return [build(**status_check) for status_check in status_checks]
 
 
 # AI agent routes
 @api_router.post("/chat", response_model=ChatResponse)
 async def chat_with_agent(request: ChatRequest):
     # Chat with AI agent
-    global search_agent, chat_agent
-    
     try:
-        # Init agents if needed
-        if request.agent_type == "search" and search_agent is None:
-            search_agent = SearchAgent(agent_config)
-            
-        elif request.agent_type == "chat" and chat_agent is None:
-            chat_agent = ChatAgent(agent_config)
-        
         # Select agent
         agent = search_agent if request.agent_type == "search" else chat_agent
         
@@ -141,24 +231,15 @@ async def chat_with_agent(request: ChatRequest):
         
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
-        return ChatResponse(
-            success=False,
-            response="",
-            agent_type=request.agent_type,
-            capabilities=[],
-            error=str(e)
-        )
+        return ORJSONResponse({**_CHAT_ERROR_TEMPLATE, "agent_type": request.agent_type, "error": str(e)})
 
 
 @api_router.post("/search", response_model=SearchResponse)
 async def search_and_summarize(request: SearchRequest):
     # Web search with AI summary
-    global search_agent
-    
     try:
-        # Init search agent if needed
         if search_agent is None:
-            search_agent = SearchAgent(agent_config)
+            raise HTTPException(status_code=500, detail="Failed to initialize agent")
         
         # Search with agent
         search_prompt = f"Search for information about: {request.query}. Provide a comprehensive summary with key findings."
@@ -173,33 +254,27 @@ async def search_and_summarize(request: SearchRequest):
                 sources_count=result.metadata.get("tools_used", 0)
             )
         else:
-            return SearchResponse(
-                success=False,
-                query=request.query,
-                summary="",
-                sources_count=0,
-                error=result.error
-            )
+            return ORJSONResponse({**_SEARCH_ERROR_TEMPLATE, "query": request.query, "error": result.error})
             
     except Exception as e:
         logger.error(f"Error in search endpoint: {e}")
-        return SearchResponse(
-            success=False,
-            query=request.query,
-            summary="",
-            sources_count=0,
-            error=str(e)
-        )
+        return ORJSONResponse({**_SEARCH_ERROR_TEMPLATE, "query": request.query, "error": str(e)})
+
+
+@lru_cache(maxsize=1)
+def _get_capabilities() -> Dict[str, List[str]]:
+    # Capabilities are static per config - build once, reuse live agents if any
+    return {
+        "search_agent": (search_agent or SearchAgent(agent_config)).get_capabilities(),
+        "chat_agent": (chat_agent or ChatAgent(agent_config)).get_capabilities()
+    }
 
 
 @api_router.get("/agents/capabilities")
 async def get_agent_capabilities():
     # Get agent capabilities
     try:
-        capabilities = {
-            "search_agent": SearchAgent(agent_config).get_capabilities(),
-            "chat_agent": ChatAgent(agent_config).get_capabilities()
-        }
+        capabilities = _get_capabilities()
         return {
             "success": True,
             "capabilities": capabilities
@@ -212,79 +287,50 @@ async def get_agent_capabilities():
         }
 
 
+def _match_category(text: str) -> str:
+    # First catalog category found in the lowercased text, else "default"
+    return next((key for key in _CATEGORY_KEYS if key in text), "default")
+
+
+def _render_wallpaper_response(prompt: str, aspect_ratio: str, style: Optional[str]) -> bytes:
+    # Deterministic in (prompt, aspect_ratio, style)
+    if aspect_ratio not in _SUPPORTED_ASPECT_RATIOS:
+        return orjson.dumps(WallpaperResponse(
+            success=False,
+            prompt=prompt,
+            aspect_ratio=aspect_ratio,
+            error=f"Unsupported aspect ratio: {aspect_ratio}"
+        ).model_dump())
+
+    # Determine which category to use based on prompt and style
+    category = _match_category(f"{prompt} {style or ''}".lower())
+
+    # Select a wallpaper based on prompt hash for consistency
+    selected_wallpapers = _WALLPAPERS_BY_RATIO[category][aspect_ratio]
+    wallpaper_index = (zlib.crc32(prompt.encode()) & 0xFF) % len(selected_wallpapers)
+
+    # URL and ratio come from the catalog, only the prompt needs escaping
+    return _WALLPAPER_RESPONSE_TEMPLATE % (
+        selected_wallpapers[wallpaper_index].encode(),
+        orjson.dumps(prompt),
+        aspect_ratio.encode()
+    )
+
+
+# Repeat requests are served from cache; long inputs bypass it to bound memory
+_cached_wallpaper_response = lru_cache(maxsize=1024)(_render_wallpaper_response)
+_CACHEABLE_INPUT_LENGTH = 256
+
+
 @api_router.post("/wallpaper/generate", response_model=WallpaperResponse)
 async def generate_wallpaper(request: WallpaperRequest):
     """Generate AI wallpaper - Returns sample/demo images for now"""
     try:
-        # For demo purposes, return curated high-quality wallpapers based on prompt keywords
-        sample_wallpapers = {
-            "nature": [
-                "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1441974231531-c6227db76b6e?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1501594907352-04cda38ebc29?w=512&h=910&fit=crop&auto=format"
-            ],
-            "city": [
-                "https://images.unsplash.com/photo-1449824913935-59a10b8d2000?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1519501025264-65ba15a82390?w=512&h=910&fit=crop&auto=format"
-            ],
-            "abstract": [
-                "https://images.unsplash.com/photo-1618005182384-a83a8bd57fbe?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1557683304-673a23048d34?w=512&h=910&fit=crop&auto=format"
-            ],
-            "space": [
-                "https://images.unsplash.com/photo-1446776877081-d282a0f896e2?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1419242902214-272b3f66ee7a?w=512&h=910&fit=crop&auto=format"
-            ],
-            "dark": [
-                "https://images.unsplash.com/photo-1618556450991-2f1af64e8191?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1547036967-23d11aacaee0?w=512&h=910&fit=crop&auto=format"
-            ],
-            "minimal": [
-                "https://images.unsplash.com/photo-1557683316-973673baf926?w=512&h=910&fit=crop&auto=format",
-                "https://images.unsplash.com/photo-1574169208507-84376144848b?w=512&h=910&fit=crop&auto=format"
-            ]
-        }
-
-        # Default wallpapers for any prompt
-        default_wallpapers = [
-            "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=512&h=910&fit=crop&auto=format",
-            "https://images.unsplash.com/photo-1441974231531-c6227db76b6e?w=512&h=910&fit=crop&auto=format",
-            "https://images.unsplash.com/photo-1449824913935-59a10b8d2000?w=512&h=910&fit=crop&auto=format",
-            "https://images.unsplash.com/photo-1618005182384-a83a8bd57fbe?w=512&h=910&fit=crop&auto=format"
-        ]
-
-        # Determine which category to use based on prompt and style
-        prompt_lower = request.prompt.lower()
-        style_lower = (request.style or "").lower()
-
-        combined_text = f"{prompt_lower} {style_lower}"
-
-        selected_wallpapers = default_wallpapers
-
-        for category, wallpapers in sample_wallpapers.items():
-            if category in combined_text:
-                selected_wallpapers = wallpapers
-                break
-
-        # Select a wallpaper based on prompt hash for consistency
-        import hashlib
-        prompt_hash = hashlib.md5(request.prompt.encode()).hexdigest()
-        wallpaper_index = int(prompt_hash[:2], 16) % len(selected_wallpapers)
-        selected_wallpaper = selected_wallpapers[wallpaper_index]
-
-        # Adjust dimensions based on aspect ratio
-        if request.aspect_ratio == "16:9":
-            selected_wallpaper = selected_wallpaper.replace("w=512&h=910", "w=910&h=512")
-        elif request.aspect_ratio == "1:1":
-            selected_wallpaper = selected_wallpaper.replace("w=512&h=910", "w=512&h=512")
-        elif request.aspect_ratio == "3:4":
-            selected_wallpaper = selected_wallpaper.replace("w=512&h=910", "w=512&h=683")
-
-        return WallpaperResponse(
-            success=True,
-            image_url=selected_wallpaper,
-            prompt=request.prompt,
-            aspect_ratio=request.aspect_ratio
+        cacheable = len(request.prompt) + len(request.style or "") <= _CACHEABLE_INPUT_LENGTH
+        render = _cached_wallpaper_response if cacheable else _render_wallpaper_response
+        return Response(
+            content=render(request.prompt, request.aspect_ratio, request.style),
+            media_type="application/json"
         )
 
     except Exception as e:
@@ -307,6 +353,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (status lists, agent responses)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Logging config
 logging.basicConfig(
     level=logging.INFO,
@@ -320,7 +369,25 @@ async def startup_event():
     global search_agent, chat_agent
     logger.info("Starting AI Agents API...")
     
-    # Lazy agent init for faster startup
+    # Warm the MongoDB connection so the first request skips the handshake
+    try:
+        await asyncio.wait_for(client.admin.command("ping"), timeout=5)
+    except asyncio.TimeoutError:
+        logger.warning("MongoDB ping timed out on startup")
+    except Exception as e:
+        logger.warning(f"MongoDB ping failed on startup: {e}")
+    
+    # Shared outbound HTTP client - pooled keep-alive connections for LLM calls
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=30.0
+    )
+    
+    # Build agents once per worker, before serving requests
+    search_agent = SearchAgent(agent_config, http_client=app.state.http)
+    chat_agent = ChatAgent(agent_config, http_client=app.state.http)
+    
     logger.info("AI Agents API ready!")
 
 
@@ -334,5 +401,6 @@ async def shutdown_db_client():
         # MCP cleanup automatic
         pass
     
+    await app.state.http.aclose()
     client.close()
     logger.info("AI Agents API shutdown complete.")
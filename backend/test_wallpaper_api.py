@@ -54,6 +54,53 @@ def test_wallpaper_generation():
     except Exception as e:
         print(f"\n❌ Error: {e}")
 
+def test_wallpaper_response_format():
+    """Test escaping, unsupported ratios and schema of wallpaper responses"""
+
+    url = "http://localhost:8001/api/wallpaper/generate"
+    print("Testing wallpaper response format...")
+    print(f"Endpoint: {url}")
+
+    cases = [
+        ({"prompt": 'A "quoted" prompt with \\ backslash', "aspect_ratio": "16:9"}, True),
+        ({"prompt": "Café au lait, 夜の街 🌃", "aspect_ratio": "1:1"}, True),
+        ({"prompt": "Mountain lake", "aspect_ratio": "2:1"}, False),
+    ]
+    expected_fields = {"success", "image_url", "prompt", "aspect_ratio", "error"}
+
+    try:
+        for payload, expected_success in cases:
+            response = requests.post(url, json=payload, timeout=30)
+            if response.status_code != 200:
+                print(f"❌ HTTP Error {response.status_code} for {payload}")
+                return False
+
+            # Body must be valid JSON with the WallpaperResponse fields
+            result = json.loads(response.content)
+
+            if set(result) != expected_fields:
+                print(f"❌ Unexpected response fields: {sorted(result)}")
+                return False
+            if result["prompt"] != payload["prompt"]:
+                print(f"❌ Prompt not round-tripped: {result['prompt']!r} != {payload['prompt']!r}")
+                return False
+            if result["success"] is not expected_success:
+                print(f"❌ Expected success={expected_success} for {payload}: {result}")
+                return False
+            if not expected_success and not result["error"]:
+                print(f"❌ Missing error for {payload}")
+                return False
+
+            print(f"✅ {payload['aspect_ratio']} {payload['prompt']!r} -> success={result['success']}")
+
+    except requests.exceptions.ConnectionError:
+        print(f"❌ Connection Error: Cannot connect to {url}")
+        print("Make sure the backend server is running on port 8001")
+        return False
+
+    print("✅ Wallpaper responses are well-formed!")
+    return True
+
 def test_basic_api():
     """Test the basic API endpoint"""
 
@@ -92,5 +139,10 @@ if __name__ == "__main__":
     # Test wallpaper generation
     test_wallpaper_generation()
 
+    print("\n" + "=" * 50)
+
+    # Test response format edge cases
+    test_wallpaper_response_format()
+
     print("\n" + "=" * 50)
     print("Testing completed!")
\ No newline at end of file
@@ -0,0 +1,105 @@
+# Wallpaper catalog matching and response rendering tests
+
+import json
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import server
+
+# Style values sent by frontend/src/components/WallpaperGenerator.jsx
+FRONTEND_STYLES = {
+    "": "default",
+    "minimalist": "minimal",
+    "abstract": "abstract",
+    "nature": "nature",
+    "cyberpunk": "default",
+    "vintage": "default",
+    "neon": "default",
+    "watercolor": "default",
+    "geometric": "default",
+    "dark mode": "dark",
+}
+
+# Prompts that must keep matching inside longer words
+SUBSTRING_PROMPTS = {
+    "Neon cityscape at night": "city",
+    "Spaceship over a red planet": "space",
+    "Darkness and fog": "dark",
+    "Minimalist lines": "minimal",
+    "Sunset over the hills": "default",
+}
+
+
+def category_for(prompt, style=""):
+    return server._match_category(f"{prompt} {style}".lower())
+
+
+def test_frontend_styles():
+    # Frontend styles pick the same category as before
+    print("1️⃣ Testing frontend style values...")
+    for style, expected in FRONTEND_STYLES.items():
+        category = category_for("Sunset over the hills", style)
+        assert category == expected, f"Style {style!r}: expected {expected}, got {category}"
+    print("✅ Frontend styles map to expected categories")
+    return True
+
+
+def test_substring_prompts():
+    # Keywords match inside longer words
+    print("\n2️⃣ Testing substring matching...")
+    for prompt, expected in SUBSTRING_PROMPTS.items():
+        category = category_for(prompt)
+        assert category == expected, f"Prompt {prompt!r}: expected {expected}, got {category}"
+    print("✅ Prompts map to expected categories")
+    return True
+
+
+def test_rendered_responses():
+    # Pre-serialized bodies escape prompts and match WallpaperResponse
+    print("\n3️⃣ Testing rendered wallpaper responses...")
+    cases = [
+        ('A "quoted" prompt with \\ backslash', "16:9", True),
+        ("Café au lait, 夜の街 🌃", "1:1", True),
+        ("Mountain lake", "2:1", False),
+    ]
+    for prompt, aspect_ratio, expected_success in cases:
+        body = server._render_wallpaper_response(prompt, aspect_ratio, None)
+        result = json.loads(body)
+        parsed = server.WallpaperResponse.model_validate_json(body)
+
+        assert result == parsed.model_dump(), f"Fields differ from WallpaperResponse: {result}"
+        assert parsed.prompt == prompt, f"Prompt not round-tripped: {parsed.prompt!r}"
+        assert parsed.aspect_ratio == aspect_ratio, f"Wrong aspect ratio: {parsed.aspect_ratio}"
+        assert parsed.success is expected_success, f"Expected success={expected_success}: {result}"
+        if expected_success:
+            assert parsed.image_url and parsed.error is None, f"Missing image: {result}"
+        else:
+            assert parsed.image_url is None and parsed.error, f"Missing error: {result}"
+    print("✅ Rendered responses parse into WallpaperResponse")
+    return True
+
+
+def main():
+    # Main test function
+    print("🧪 Wallpaper Catalog Test")
+    print("=" * 25)
+
+    try:
+        test_frontend_styles()
+        test_substring_prompts()
+        test_rendered_responses()
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return False
+
+    print("\n🎉 Wallpaper catalog matching works!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)